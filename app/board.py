@@ -1,13 +1,167 @@
+import functools
+import sys
+
 try:
     from app.rules import Rules
-    from app.config import Config
+    from app.config import Config, USE_COLOR as _USE_COLOR
 except ImportError:
     from rules import Rules
-    from config import Config
+    from config import Config, USE_COLOR as _USE_COLOR
 from colorama import init, Style
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+# Cached reset code so the render path skips the Style attribute lookup
+_RESET = Style.RESET_ALL
+
+# Colorama is only initialized when something is actually displayed, so
+# importing/constructing boards headlessly never wraps stdout
+_colorama_initialized = False
+
+
+def _ensure_colorama():
+    '''Initializes colorama once, on first display use (TTY only).'''
+    global _colorama_initialized
+    if _USE_COLOR and not _colorama_initialized:
+        init(autoreset=True)
+        _colorama_initialized = True
+
+
+# Room layout data is static, so it is built once at import time as
+# immutable tuples; Board construction and door lookups reference it.
+_ROOM_LAYOUTS = {
+    "Kitchen": {
+        "position": (0, 0),  # Top-left corner position on board
+        "size": (5, 6),
+        "door_locations": ((4, 4),),      # Length x Width
+        "exit_offsets": ((5, 4),),  # Where player ends up when exiting through each door
+        "layout": (
+            '######',
+            '#KKKK#',
+            '#KKKK#',
+            '#KKKK#',
+            '####d#'  
+        )
+    },
+    "Ballroom": {
+        "position": (0, 8),
+        "size": (6, 7),
+        "door_locations": ((5, 0), (6, 1),(6,4), (5, 6)),
+        "exit_offsets": ((5, -1), (7, 1), (7, 4), (5, 7)), 
+        "layout": (
+            '..###..',
+            '##BBB##',
+            '#BBBBB#',
+            '#BBBBB#',
+            '#BBBBB#',
+            'dBBBBBd',
+            '#d##d##'
+        )
+    },
+    "Conservatory": {
+        "position": (0, 16),
+        "size": (4, 5),
+        "door_locations": ((2, 0),),
+        "exit_offsets": ((2, -1),),
+        "layout": (
+            '######', 
+            '#CCCC#',
+            'dCCCC#',
+            '.####.',
+        )
+    },
+    "Dining Room": {
+        "position": (7, 0),
+        "size": (7, 8),
+            "door_locations": ((4,7), (6, 4)),
+        "exit_offsets": ((4, 8), (7, 4)),  
+        "layout": (
+            '#####...',
+            '#DDDD###',
+            '#DDDDDD#',
+            '#DDDDDD#',
+            '#DDDDDDd',
+            '#DDDDDD#',
+            '####d###'
+        )
+    },
+    "Lounge": {
+        "position": (17, 0),
+        "size": (5, 7),
+        "door_locations": ((0, 6),),
+        "exit_offsets": ((0, 7),),  # Right door
+        "layout": (
+            '######d',
+            '#OOOOO#',
+            '#OOOOO#',
+            '#OOOOO#',
+            '#######'
+        )
+    },
+    "Hall": {
+        "position": (16, 9),
+        "size": (6, 6),
+        "door_locations": ((0, 2), (0, 3), (5, 5)),
+        "exit_offsets": ((-1, 2), (-1, 3), (5, 6)),  
+        "layout": (
+            '##dd##',
+            '#HHHH#',
+            '#HHHH#',
+            '#HHHHd',
+            '#HHHH#',
+            '######'
+
+        )
+    },
+    "Study": {
+        "position": (19, 16),
+        "size": (3, 6),
+        "door_locations": ((0, 1),),
+        "exit_offsets": ((-1, 1),),  # Top door
+        "layout": (
+            '#d####',  
+            '#SSSS#',
+            '######'
+        )
+    },
+    "Library": {
+        "position": (12, 16),
+        "size": (5, 6),
+        "door_locations": ((2, 0), (0, 4)),
+        "exit_offsets": ((2, -1), (-1, 4)), 
+        "layout": (
+            '.###d#',
+            '#LLLL#',
+            'dLLLL#',
+            '#LLLL#',
+            '.#####'
+        )
+    },
+    "Billiard Room": {
+        "position": (6, 17),
+        "size": (5, 5),
+        "door_locations": ((1, 0),(0,3)),
+        "exit_offsets": ((1, -1), (-1, 3)),  
+        "layout": (
+            '###d#',
+            'dRRR#',
+            '#RRR#',
+            '#RRR#',
+            '#####'
+        )
+    }
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_rules():
+    '''Returns the Rules instance shared by all Board objects.'''
+    return Rules()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_config():
+    '''Returns the Config instance shared by all Board objects.'''
+    return Config()
+
 
 class Board:
     '''Represents the game board.
@@ -20,45 +174,100 @@ class Board:
     '''
     BAR_LENGTH = 50
 
+    __slots__ = (
+        'board_length', 'board_width', 'rooms', '_sorted_room_names',
+        'weapons', 'suspects', 'player_colors', 'player_symbols',
+        'player_start_positions', 'weapons_rooms', '_weapons_by_room',
+        'current_player_positions', 'rules', '_room_name_to_symbol',
+        'board', '_room_layouts', '_door_positions', '_exit_positions',
+        '_door_cells', '_door_prompts', '_wall_mask', '_door_mask'
+    )
+
     def __init__(self):
-        rules = Rules()
-        config = Config()
+        rules = _shared_rules()
+        config = _shared_config()
         self.board_length, self.board_width = rules.get_dimensions()
-        self.rooms = {}
-        for room in rules.get_rooms():
-            self.rooms[room] = room[0]
+        self.rooms = {room: room[0] for room in rules.get_rooms()}
+        # Room names pre-sorted once for the per-frame display groupings
+        self._sorted_room_names = tuple(sorted(self.rooms))
         self.weapons = rules.get_weapons()
         self.suspects = rules.get_suspects()
         self.player_colors = config.get_player_colors()
         self.player_symbols = rules.get_player_symbols()
         self.player_start_positions = config.get_player_start_positions()
         self.weapons_rooms = config.get_weapon_rooms()
-        self.current_player_positions = {}  # (row, col) -> player name
+        # Inverse room -> weapons index, kept in sync by place_weapon_in_room
+        # so the display path doesn't regroup every frame
+        self._weapons_by_room = {}
+        for weapon, room in self.weapons_rooms.items():
+            self._weapons_by_room.setdefault(room, []).append(weapon)
+        self.current_player_positions = {}  # (row, col) -> Player object
         self.rules = rules
+        # Inverted board-symbol mapping for O(1) room name -> symbol lookups
+        self._room_name_to_symbol = {
+            name: symbol for symbol, name in rules.get_board_symbols().items()
+        }
         
         # Initialize board with empty spaces
-        self.board = []
-        for i in range(self.board_length):
-            row = []
-            for j in range(self.board_width):
-                row.append('.')
-            self.board.append(row)
+        self.board = [['.'] * self.board_width for _ in range(self.board_length)]
 
-        room_layout = self.get_room_layouts()
+        # Room layouts are the shared module constant; the per-room door
+        # and exit positions are precomputed so lookups during play are
+        # plain dict hits instead of rebuilding the layout dict each call.
+        self._room_layouts = _ROOM_LAYOUTS
+        self._door_positions = {}
+        self._exit_positions = {}
+        self._door_cells = {}
+        self._door_prompts = {}
+        for room_name, room_info in self._room_layouts.items():
+            pos_x, pos_y = room_info["position"]
+            self._door_positions[room_name] = tuple(
+                (pos_x + dx, pos_y + dy) for dx, dy in room_info["door_locations"]
+            )
+            self._exit_positions[room_name] = tuple(
+                (pos_x + dx, pos_y + dy) for dx, dy in room_info["exit_offsets"]
+            )
+            # Layout-relative door cell -> display number, so rendering a
+            # room never rescans door_locations
+            self._door_cells[room_name] = {
+                door_pos: str(idx + 1)
+                for idx, door_pos in enumerate(room_info["door_locations"])
+            }
+            self._door_prompts[room_name] = "Available doors: " + ", ".join(
+                str(idx + 1) for idx in range(len(room_info["door_locations"]))
+            )
 
-        for room_name, room_info in room_layout.items():
+        # Stamp each room with clipped slice assignments: the row/column
+        # extents are clamped up front, so no per-cell bounds check runs
+        for room_info in self._room_layouts.values():
             pos_x, pos_y = room_info["position"]
             layout = room_info["layout"]
-            for i, row in enumerate(layout):
-                for j, cell in enumerate(row):
-                    if pos_x + i < self.board_length and pos_y + j < self.board_width:
-                        self.board[pos_x + i][pos_y + j] = cell
+            rows = min(len(layout), self.board_length - pos_x)
+            for i in range(rows):
+                row = layout[i]
+                cols = min(len(row), self.board_width - pos_y)
+                self.board[pos_x + i][pos_y:pos_y + cols] = row[:cols]
 
+        # Walls and doors never move after construction, so record their
+        # positions once and answer is_wall/is_door with set membership.
+        self._wall_mask = frozenset(
+            (i, j)
+            for i, row in enumerate(self.board)
+            for j, cell in enumerate(row)
+            if cell == '#'
+        )
+        self._door_mask = frozenset(
+            (i, j)
+            for i, row in enumerate(self.board)
+            for j, cell in enumerate(row)
+            if cell == 'd'
+        )
 
-        
     def apply_color_to_text(self, text, color):
-        '''Apply colorama color to text with auto-reset.'''
-        return f"{color}{text}{Style.RESET_ALL}"
+        '''Apply colorama color to text with auto-reset (plain text off-TTY).'''
+        if not _USE_COLOR:
+            return text
+        return f"{color}{text}{_RESET}"
 
     def display_room_layout(self, room_name):
         '''Displays the room layout with numbered doors.
@@ -68,30 +277,26 @@ class Board:
         '''
         room_layouts = self.get_room_layouts()
         room_layout = room_layouts.get(room_name)
-        
+
         if not room_layout:
             return
-        
-        print(f"\n{room_name} Layout:")
-        door_locations = room_layout['door_locations']
+
+        _ensure_colorama()
         layout = room_layout['layout']
-        
-        # Create a copy of the layout with numbered doors
+
+        # Door cell -> display number maps are precomputed per room, so
+        # each cell is a single dict lookup instead of a scan of doors
+        door_lookup = self._door_cells[room_name]
+
+        # Render the layout with numbered doors, one write for the frame
+        lines = [f"\n{room_name} Layout:"]
         for row_idx, row in enumerate(layout):
-            row_str = ""
-            for col_idx, cell in enumerate(row):
-                # Check if this position is a door
-                door_number = None
-                for idx, door_pos in enumerate(door_locations):
-                    if (row_idx, col_idx) == door_pos:
-                        door_number = idx + 1
-                        break
-                
-                if door_number:
-                    row_str += str(door_number) + " "
-                else:
-                    row_str += cell + " "
-            print(row_str)
+            tokens = [
+                door_lookup.get((row_idx, col_idx), cell)
+                for col_idx, cell in enumerate(row)
+            ]
+            lines.append(' '.join(tokens) + ' ')
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def get_door_locations(self, room_name):
         '''Returns the door locations for a given room.
@@ -100,14 +305,14 @@ class Board:
             room_name: Name of the room
             
         Returns:
-            list: List of door location tuples, or empty list if room not found
+            tuple: Door location tuples, or empty tuple if room not found
         '''
         room_layouts = self.get_room_layouts()
         room_layout = room_layouts.get(room_name)
-        
+
         if room_layout:
             return room_layout['door_locations']
-        return []
+        return ()
     
     def get_room_layout(self, room_name):
         '''Returns the layout information for a given room.
@@ -122,143 +327,14 @@ class Board:
         room_layouts = self.get_room_layouts()
         return room_layouts.get(room_name)
 
-    def move_player_on_board(self):
-        "''Moves a player on the board.'''"
-
     def get_room_symbol(self, room_name):
         '''Returns the symbol for a given room from the board symbols mapping.'''
-        # Get the symbol to room name mapping from rules
-        board_symbols = self.rules.get_board_symbols()
-        # Reverse lookup: find symbol where value equals room_name
-        for symbol, name in board_symbols.items():
-            if name == room_name:
-                return symbol
-        return None
+        return self._room_name_to_symbol.get(room_name)
         
     def get_room_layouts(self):
-        '''Returns 2D layouts for each room with halls (.), walls (#), doors (d), room spaces (R).'''
-        return {
-            "Kitchen": {
-                "position": (0, 0),  # Top-left corner position on board
-                "size": (5, 6),
-                "door_locations": [(4, 4)],      # Length x Width
-                "exit_offsets": [(5, 4)],  # Where player ends up when exiting through each door
-                "layout": [
-                    ['#', '#', '#', '#', '#', '#'],
-                    ['#', 'K', 'K', 'K', 'K', '#'],
-                    ['#', 'K', 'K', 'K', 'K', '#'],
-                    ['#', 'K', 'K', 'K', 'K', '#'],
-                    ['#', '#', '#', '#', 'd', '#']  
-                ]
-            },
-            "Ballroom": {
-                "position": (0, 8),
-                "size": (6, 7),
-                "door_locations": [(5, 0), (6, 1),(6,4), (5, 6)],
-                "exit_offsets": [(5, -1), (7, 1), (7, 4), (5, 7)], 
-                "layout": [
-                    ['.', '.', '#', '#', '#', '.', '.'],
-                    ['#', '#', 'B', 'B', 'B', '#', '#'],
-                    ['#', 'B', 'B', 'B', 'B', 'B', '#'],
-                    ['#', 'B', 'B', 'B', 'B', 'B', '#'],
-                    ['#', 'B', 'B', 'B', 'B', 'B', '#'],
-                    ['d', 'B', 'B', 'B', 'B', 'B', 'd'],
-                    ['#', 'd', '#', '#', 'd', '#', '#']
-                ]
-            },
-            "Conservatory": {
-                "position": (0, 16),
-                "size": (4, 5),
-                "door_locations": [(2, 0)],
-                "exit_offsets": [(2, -1)],
-                "layout": [
-                    ['#', '#', '#', '#', '#', '#'], 
-                    ['#', 'C', 'C', 'C', 'C', '#'],
-                    ['d', 'C', 'C', 'C', 'C', '#'],
-                    ['.', '#', '#', '#', '#', '.'],
-                ]
-            },
-            "Dining Room": {
-                "position": (7, 0),
-                "size": (7, 8),
-                    "door_locations": [(4,7), (6, 4)],
-                "exit_offsets": [(4, 8), (7, 4)],  
-                "layout": [
-                    ['#', '#', '#', '#', '#', '.', '.', '.'],
-                    ['#','D', 'D', 'D', 'D', '#', '#', '#'],
-                    ['#', 'D', 'D', 'D', 'D', 'D', 'D', '#'],
-                    ['#', 'D', 'D', 'D', 'D', 'D', 'D', '#'],
-                    ['#', 'D', 'D', 'D', 'D', 'D', 'D', 'd'],
-                    ['#', 'D', 'D', 'D', 'D', 'D', 'D', '#'],
-                    ['#', '#', '#', '#', 'd', '#', '#', '#']
-                ]
-            },
-            "Lounge": {
-                "position": (17, 0),
-                "size": (5, 7),
-                "door_locations": [(0, 6)],
-                "exit_offsets": [(0, 7)],  # Right door
-                "layout": [
-                    ['#','#','#', '#', '#', '#', 'd'],
-                    ['#', 'O', 'O', 'O', 'O', 'O', '#'],
-                    ['#','O', 'O', 'O', 'O', 'O', '#'],
-                    ['#', 'O','O', 'O', 'O', 'O', '#'],
-                    ['#','#', '#', '#', '#', '#', '#']
-                ]
-            },
-            "Hall": {
-                "position": (16, 9),
-                "size": (6, 6),
-                "door_locations": [(0, 2), (0, 3), (5, 5)],
-                "exit_offsets": [(-1, 2), (-1, 3), (5, 6)],  
-                "layout": [
-                    ['#','#','d', 'd','#','#'],
-                    ['#', 'H', 'H', 'H','H', '#'],
-                    ['#', 'H', 'H', 'H','H', '#'],
-                    ['#', 'H', 'H', 'H','H', 'd'],
-                    ['#', 'H', 'H', 'H','H', '#'],
-                    ['#', '#', '#', '#','#', '#']
-
-                ]
-            },
-            "Study": {
-                "position": (19, 16),
-                "size": (3, 6),
-                "door_locations": [(0, 1)],
-                "exit_offsets": [(-1, 1)],  # Top door
-                "layout": [
-                    ['#', 'd', '#', '#', '#', '#'],  
-                    ['#', 'S', 'S', 'S', 'S', '#'],
-                    ['#', '#', '#', '#', '#', '#']
-                ]
-            },
-            "Library": {
-                "position": (12, 16),
-                "size": (5, 6),
-                "door_locations": [(2, 0), (0, 4)],
-                "exit_offsets": [(2, -1), (-1, 4)], 
-                "layout": [
-                    ['.', '#', '#', '#', 'd', '#'],
-                    ['#', 'L', 'L', 'L', 'L', '#'],
-                    ['d', 'L', 'L', 'L', 'L', '#'],
-                    ['#', 'L', 'L', 'L', 'L', '#'],
-                    ['.', '#', '#', '#', '#', '#']
-                ]
-            },
-            "Billiard Room": {
-                "position": (6, 17),
-                "size": (5, 5),
-                "door_locations": [(1, 0),(0,3)],
-                "exit_offsets": [(1, -1), (-1, 3)],  
-                "layout": [
-                    ['#', '#', '#', 'd', '#'],
-                    ['d', 'R', 'R', 'R', '#'],
-                    ['#', 'R', 'R', 'R', '#'],
-                    ['#', 'R', 'R', 'R', '#'],
-                    ['#', '#', '#', '#', '#']
-                ]
-            }
-        }
+        '''Returns the cached 2D layouts for each room.'''
+        return self._room_layouts
+
 
 
     def display_board(self, players):
@@ -268,28 +344,34 @@ class Board:
         Args:
             players: List of Player objects
         '''
+        _ensure_colorama()
+
         # Display weapons in rooms
         self.display_weapons_in_rooms()
 
-        # Build position map only for players NOT in rooms
-        position_to_player = {}
-        for player in players:
-            if player.get_current_room() is None:  # Only show players in hallways
-                pos = player.current_position
-                position_to_player[pos] = player
+        # Overlay from the players list, not current_player_positions:
+        # the tracked map is only populated once a player moves, while
+        # start positions must render from the very first frame
+        position_to_player = {
+            player.current_position: player
+            for player in players
+            if player.get_current_room() is None
+            and player.current_position is not None
+        }
         
-        # Display the board
+        # Build the whole frame and emit it with a single write; player
+        # symbols use the colored string cached on each Player
+        lines = []
         for row_idx, row in enumerate(self.board):
             colored_row = []
             for col_idx, cell in enumerate(row):
-                if (row_idx, col_idx) in position_to_player:
-                    player = position_to_player[(row_idx, col_idx)]
-                    colored_cell = self.apply_color_to_text(player.symbol, player.color)
-                    colored_row.append(colored_cell)
+                occupant = position_to_player.get((row_idx, col_idx))
+                if occupant is not None:
+                    colored_row.append(occupant.get_colored_symbol())
                 else:
                     colored_row.append(cell)
-            
-            print(' '.join(colored_row))
+            lines.append(' '.join(colored_row))
+        sys.stdout.write('\n'.join(lines) + '\n')
         
         # Display players in rooms at the bottom
         self.display_players_in_rooms(players)
@@ -300,52 +382,45 @@ class Board:
         Args:
             players: List of Player objects
         '''
-        players_in_rooms = []
-        for p in players:
-            if p.get_current_room() is not None:
-                players_in_rooms.append(p)
-        
-        if players_in_rooms:
-            print("\n" + "=" * self.BAR_LENGTH)
-            print("PLAYERS IN ROOMS:".center(self.BAR_LENGTH))
-            print("=" * self.BAR_LENGTH)
-            
-            # Group players by room
-            rooms_dict = {}
-            for player in players_in_rooms:
-                room = player.get_current_room()
-                if room not in rooms_dict:
-                    rooms_dict[room] = []
-                rooms_dict[room].append(player)
-            
-            # Display each room and its occupants
-            for room_name in sorted(rooms_dict.keys()):
-                print(f"\n{room_name}:")
-                for player in rooms_dict[room_name]:
-                    print(f"  {player.get_colored_symbol()} - {player.get_colored_name()}")
-            
-            print("=" * self.BAR_LENGTH)
+        # Filter and group players by room in a single pass
+        rooms_dict = {}
+        for player in players:
+            room = player.get_current_room()
+            if room is not None:
+                rooms_dict.setdefault(room, []).append(player)
+
+        if rooms_dict:
+            bar = "=" * self.BAR_LENGTH
+            lines = ["\n" + bar, "PLAYERS IN ROOMS:".center(self.BAR_LENGTH), bar]
+
+            # Collect each room and its occupants
+            for room_name in self._sorted_room_names:
+                occupants = rooms_dict.get(room_name)
+                if not occupants:
+                    continue
+                lines.append(f"\n{room_name}:")
+                for player in occupants:
+                    lines.append(f"  {player.get_colored_symbol()} - {player.get_colored_name()}")
+
+            lines.append(bar)
+            print("\n".join(lines))
     
     def display_weapons_in_rooms(self):
         '''Displays which weapons are currently in rooms.'''
-        print("\n" + "=" * self.BAR_LENGTH)
-        print("WEAPONS IN ROOMS:".center(self.BAR_LENGTH))
-        print("=" * self.BAR_LENGTH)
-        
-        # Group weapons by room
-        rooms_dict = {}
-        for weapon, room in self.weapons_rooms.items():
-            if room not in rooms_dict:
-                rooms_dict[room] = []
-            rooms_dict[room].append(weapon)
-        
-        # Display each room and its weapons
-        for room_name in sorted(rooms_dict.keys()):
-            print(f"\n{room_name}:")
-            for weapon in rooms_dict[room_name]:
-                print(f"  {weapon}")
-        
-        print("=" * self.BAR_LENGTH)
+        bar = "=" * self.BAR_LENGTH
+        lines = ["\n" + bar, "WEAPONS IN ROOMS:".center(self.BAR_LENGTH), bar]
+
+        # Collect each room and its weapons from the maintained index
+        for room_name in self._sorted_room_names:
+            weapons = self._weapons_by_room.get(room_name)
+            if not weapons:
+                continue
+            lines.append(f"\n{room_name}:")
+            for weapon in weapons:
+                lines.append(f"  {weapon}")
+
+        lines.append(bar)
+        print("\n".join(lines))
     
     def place_weapon_in_room(self, weapon, room_name):
         '''Places a weapon in a specified room.
@@ -354,7 +429,17 @@ class Board:
             weapon: Name of the weapon (e.g., "Candlestick")
             room_name: Name of the room (e.g., "Kitchen")
         '''
+        old_room = self.weapons_rooms.get(weapon)
+        if old_room == room_name:
+            return
+        if old_room is not None:
+            room_weapons = self._weapons_by_room.get(old_room)
+            if room_weapons and weapon in room_weapons:
+                room_weapons.remove(weapon)
+                if not room_weapons:
+                    del self._weapons_by_room[old_room]
         self.weapons_rooms[weapon] = room_name
+        self._weapons_by_room.setdefault(room_name, []).append(weapon)
 
     def place_player_in_room(self, player, room_name):
         '''Places a player in a room.
@@ -369,15 +454,17 @@ class Board:
         if room_name in self.rooms:
             # Restore old position to "." if player was in hallway
             # Use previous_position since current_position is already set to None by enter_room()
-            old_pos = player.get_previous_position()
-            if old_pos is not None and old_pos in self.current_player_positions:
-                x, y = old_pos
-                self.board[x][y] = '.'
-                del self.current_player_positions[old_pos]
-            
+            self._vacate(player.get_previous_position())
+
             player.current_room = room_name
             return True
         return False
+
+    def _vacate(self, old_pos):
+        '''Clears a tracked hallway position, restoring its board cell to ".".'''
+        if old_pos is not None and self.current_player_positions.pop(old_pos, None) is not None:
+            x, y = old_pos
+            self.board[x][y] = '.'
     
     def move_player_to_hallway(self, player, position):
         '''Moves a player from a room to a hallway position.
@@ -387,12 +474,9 @@ class Board:
             position: (row, col) tuple for new hallway position
         '''
         # If player was in a hallway before, restore that position to "."
-        old_pos = player.current_position
-        if player.current_room is None and old_pos in self.current_player_positions:
-            x, y = old_pos
-            self.board[x][y] = '.'
-            del self.current_player_positions[old_pos]
-        
+        if player.current_room is None:
+            self._vacate(player.current_position)
+
         # Remove from room
         player.current_room = None
         
@@ -400,25 +484,29 @@ class Board:
         x, y = position
         player.current_position = position
         self.board[x][y] = player.symbol
-        self.current_player_positions[position] = player.name
+        self.current_player_positions[position] = player
     
     def move_player(self, player):
-        x, y = player.get_player_position()
-        
+        new_pos = player.get_player_position()
+        x, y = new_pos
+
+        # Fast path: the player is already placed on this square, so the
+        # vacate/delete/insert round trip would be a no-op
+        if player.current_room is None and \
+                self.current_player_positions.get(new_pos) is player:
+            return True
+
         # Restore old position to "."
-        old_pos = player.get_previous_position()
-        if player.current_room is None and old_pos is not None and old_pos in self.current_player_positions:
-            old_x, old_y = old_pos
-            self.board[old_x][old_y] = '.'
-            del self.current_player_positions[old_pos]
-        
+        if player.current_room is None:
+            self._vacate(player.get_previous_position())
+
         # Clear room status if they were in one
         player.current_room = None
-        
+
         # Place player at new position
         self.board[x][y] = player.symbol
-        self.current_player_positions[player.get_player_position()] = player.name
-        
+        self.current_player_positions[new_pos] = player
+
         return True
     
     def get_dimensions(self):
@@ -427,31 +515,26 @@ class Board:
     
     def is_wall(self, position):
         '''Check if the given position is a wall.'''
-        row, col = position
-        return self.board[row][col] == '#'
-    
+        return position in self._wall_mask
+
     def is_occupied(self, position):
         '''Check if the given position is occupied by a player.'''
         return position in self.current_player_positions
-    
+
     def is_door(self, position):
         '''Check if the given position is a door.'''
-        row, col = position
-        return self.board[row][col] == 'd'
-    
+        return position in self._door_mask
+
+    def get_door_prompt(self, room_name):
+        '''Returns the preformatted "Available doors: ..." prompt for a room.'''
+        return self._door_prompts.get(room_name, "Available doors: ")
+
     def get_door_positions(self, room_name):
-        '''Returns the door positions for a given room.'''
-        room_layout = self.get_room_layouts()
-        if room_name in room_layout:
-            door_offsets = room_layout[room_name]['door_locations']
-            room_pos = room_layout[room_name]['position']
-            door_positions = [(room_pos[0] + offset[0], room_pos[1] + offset[1]) for offset in door_offsets]
-            return door_positions
-        return []
-            
-if __name__ == "__main__":
-    board = Board()
-    board.display_legend()
-    board.display_board()
-    
+        '''Returns the precomputed board positions of a room's doors.'''
+        return self._door_positions.get(room_name, ())
+
+    def get_exit_positions(self, room_name):
+        '''Returns the precomputed board positions players exit to from a room's doors.'''
+        return self._exit_positions.get(room_name, ())
+
     
\ No newline at end of file
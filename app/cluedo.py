@@ -1,5 +1,6 @@
 import random
-import os
+import sys
+from collections import deque
 
 try:
     from app.rules import Rules
@@ -45,8 +46,12 @@ class Cluedo:
     ACTION_SECRET_PASSAGE = "secret"
     ACTION_SHOW_CARDS = "show"
     
-    # Actions that automatically end the turn
-    ACTIONS_THAT_END_TURN = ["accuse", "suggest", "enter", "secret", "end"]
+    # Actions that automatically end the turn (frozenset for O(1) membership
+    # checks on every action entered during a turn)
+    ACTIONS_THAT_END_TURN = frozenset({"accuse", "suggest", "enter", "secret", "end"})
+
+    # Keys shared by suggestion and accusation dicts
+    SUGGESTION_KEYS = ("suspect", "weapon", "room")
 
     # Dev input
     DEV_INPUT_TEST_MOVEMENT = "uula"
@@ -61,17 +66,33 @@ class Cluedo:
         self.rules = Rules()
         self.board = Board()
         self.config = Config()
+        # Card categories never change mid-game, so keep immutable copies
+        # here instead of going through Rules on every use
+        self._suspects = tuple(self.rules.get_suspects())
+        self._weapons = tuple(self.rules.get_weapons())
+        self._rooms = tuple(self.rules.get_rooms())
+        # One PRNG instance for the whole game: skips the module-level
+        # random's attribute lookups and lock on every draw
+        self._rng = random.Random()
+        # Formatted once; the enter-room prompt never changes during a game
+        self._room_prompt = ", ".join(
+            f"{room} ({self.board.get_room_symbol(room)})" for room in self._rooms
+        )
         self.cards = []
         self.removed_cards = []
         self.initialize_cards()
         self.players = []
+        self._players_by_name = {}  # name -> Player for O(1) lookups
         self.current_turn_index = 0
         self.solution = self.generate_solution()
         self.previous_moves = []  # Track positions during current player's turn
-        self.suggestion_log = []  # Track all suggestions and refutations
-        for card in self.solution.values():
-            self.remove_card_from_deck(card, self.cards)
-            self.add_card_to_deck(card, self.removed_cards)
+        self.suggestion_log = deque()  # Track all suggestions and refutations
+        # Pull the solution cards out of the deck in one pass instead of
+        # one remove/add round trip per card
+        solution_cards = set(self.solution.values())
+        self.cards = [card for card in self.cards if card not in solution_cards]
+        self._card_set -= solution_cards
+        self.removed_cards.extend(self.solution.values())
         self.create_players()
         self.distribute_cards()
         self.setup_action_factory()
@@ -97,9 +118,25 @@ class Cluedo:
         self.action_factory.register_action(self.ACTION_SECRET_PASSAGE, SecretPassageAction)
         self.action_factory.register_action(self.ACTION_SHOW_CARDS, ShowCardsAction)
 
+        # Registrations are final, so the help text can be assembled once
+        self._actions_prompt = self._build_actions_prompt()
+
+    def _build_actions_prompt(self):
+        '''Assembles the available-actions help text from action descriptions.'''
+        lines = ["Available actions:"]
+        for action_name in self.action_factory.get_registered_actions():
+            if action_name:  # Skip empty string action
+                try:
+                    action = self.action_factory.create_action(action_name)
+                    description = action.get_description()
+                    lines.append(f"- {action_name}: {description}")
+                except Exception:
+                    lines.append(f"- {action_name}: (No description available)")
+        return "\n".join(lines)
+
     def distribute_cards(self):
         '''Distributes the remaining cards equally among all players.'''
-        random.shuffle(self.cards)
+        self._rng.shuffle(self.cards)
         num_players = len(self.players)
         
         card_index = 0
@@ -142,7 +179,7 @@ class Cluedo:
 
     def create_players(self):
         '''Creates all player objects for the game.'''
-        suspects = self.rules.get_suspects()
+        suspects = self._suspects
         player_symbols = self.rules.get_player_symbols()
         player_colors = self.config.get_player_colors()
         start_positions = self.config.get_player_start_positions()
@@ -160,6 +197,7 @@ class Cluedo:
                         start_position=start_positions[suspect]
                     )
                     self.players.append(player)
+                    self._players_by_name[suspect] = player
                     print(f"{suspect} is set as ACTIVE.")
                     break
                 elif response == 'n':
@@ -170,6 +208,7 @@ class Cluedo:
                         start_position=start_positions[suspect]
                     )
                     self.players.append(player)
+                    self._players_by_name[suspect] = player
                     print(f"{suspect} is set as INACTIVE (can refute but won't take turns).")
                     break
                 else:
@@ -184,10 +223,7 @@ class Cluedo:
     
     def get_player_by_name(self, name):
         '''Returns a player by their name.'''
-        for player in self.players:
-            if player.name == name:
-                return player
-        return None
+        return self._players_by_name.get(name)
     
     def display_players(self):
         '''Display information about all players.'''
@@ -211,30 +247,30 @@ class Cluedo:
         # Create eliminated player from existing player
         eliminated = EliminatedPlayer.from_player(player)
         
-        # Replace in players list
+        # Replace in players list and name lookup
         self.players[player_index] = eliminated
-        
+        self._players_by_name[eliminated.name] = eliminated
+
         return eliminated
 
     # Solution 
 
     def generate_solution(self):
         '''Generates a random solution by selecting one suspect, one weapon, and one room.'''
-        suspects = self.rules.get_suspects()
-        weapons = self.rules.get_weapons()
-        rooms = self.rules.get_rooms()
-        
-        # Randomly select one from each category
-        solution_suspect = random.choice(suspects)
-        solution_weapon = random.choice(weapons)
-        solution_room = random.choice(rooms)
-        
+        # One getrandbits call yields all three indices: each 32-bit slice
+        # is mapped onto its category with a multiply-shift, replacing
+        # three random.choice calls (and their rejection sampling)
+        bits = self._rng.getrandbits(96)
+        suspect_index = (bits & 0xFFFFFFFF) * len(self._suspects) >> 32
+        weapon_index = ((bits >> 32) & 0xFFFFFFFF) * len(self._weapons) >> 32
+        room_index = (bits >> 64) * len(self._rooms) >> 32
+
         solution = {
-            "suspect": solution_suspect,
-            "weapon": solution_weapon,
-            "room": solution_room
+            "suspect": self._suspects[suspect_index],
+            "weapon": self._weapons[weapon_index],
+            "room": self._rooms[room_index]
         }
-        
+
         return solution
 
     def get_solution(self):
@@ -250,9 +286,7 @@ class Cluedo:
         Returns:
             bool: True if accusation matches solution exactly
         '''
-        return (accusation['suspect'] == self.solution['suspect'] and
-                accusation['weapon'] == self.solution['weapon'] and
-                accusation['room'] == self.solution['room'])
+        return all(accusation[key] == self.solution[key] for key in self.SUGGESTION_KEYS)
 
     def display_solution(self, solution):
         '''Displays the solution in a formatted way.'''
@@ -270,27 +304,38 @@ class Cluedo:
 
     def initialize_cards(self) -> None:
         '''Initializes the deck of cards for the game.'''
-        self.cards = (
-            self.rules.get_suspects() +
-            self.rules.get_weapons() +
-            self.rules.get_rooms()
-        )
+        # Intern the names so the set/dict probes done on every suggestion
+        # and refutation compare by pointer instead of hashing the string.
+        self.cards = [
+            sys.intern(card)
+            for card in self._suspects + self._weapons + self._rooms
+        ]
+        self._card_set = set(self.cards)  # Mirrors self.cards for O(1) membership
     
     def display_cards(self, cards: list) -> None:
         '''Prints all the cards in the deck.'''
-        print("\n=== CLUEDO CARDS ===")
-        for card in cards:
-            print(f"- {card}")
-        print("=====================\n")
+        lines = ["\n=== CLUEDO CARDS ==="]
+        lines.extend(f"- {card}" for card in cards)
+        lines.append("=====================\n")
+        print("\n".join(lines))
 
     def remove_card_from_deck(self, card: str, cards: list) -> None:
         '''Removes a specific card from the deck.'''
-        if card in cards:
+        # The main deck has a set mirror, so its membership check is O(1)
+        if cards is self.cards:
+            if card in self._card_set:
+                self._card_set.remove(card)
+                cards.remove(card)
+        elif card in cards:
             cards.remove(card)
 
     def add_card_to_deck(self, card: str, cards: list) -> None:
         '''Adds a specific card back to the deck.'''
-        if card not in cards:
+        if cards is self.cards:
+            if card not in self._card_set:
+                self._card_set.add(card)
+                cards.append(card)
+        elif card not in cards:
             cards.append(card)
 
     def get_cards(self) -> list:
@@ -303,13 +348,14 @@ class Cluedo:
 
 # Player Turns
     def play_turn(self, player: Player) -> bool:
-        print(f"\nIt's {player.get_colored_name()}'s turn!")
-        
+        player_name = player.get_colored_name()
+        print(f"\nIt's {player_name}'s turn!")
+
         # Clear previous moves list at start of turn
         self.previous_moves = []
-        
+
         moves = self.roll_die(player)
-        print(f"{player.get_colored_name()} has {moves} moves for their turn.")
+        print(f"{player_name} has {moves} moves for their turn.")
         while True:
             try:
                 choice = input("Enter an action or leave blank to see the list of actions: ")
@@ -363,6 +409,10 @@ class Cluedo:
         '''Returns the game board.'''
         return self.board
 
+    def get_room_prompt(self) -> str:
+        '''Returns the preformatted "Room (symbol)" listing for prompts.'''
+        return self._room_prompt
+
     def roll_die(self, player: Player) -> int:
         '''Play a turn for the given player.'''
         devop = input("\n Press enter to roll dice...")
@@ -375,7 +425,10 @@ class Cluedo:
 
     def clear_screen(self):
         '''Clears the terminal screen.'''
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # ANSI clear + cursor home: no shell subprocess per turn. Colorama
+        # translates the escape codes on legacy Windows consoles.
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
     def refute_suggestion(self, suggesting_player: Player, suggestion: dict) -> tuple:
         '''Handles the refutation process for a suggestion.
@@ -392,7 +445,8 @@ class Cluedo:
         '''
         # Get suggesting player's index
         suggester_index = self.players.index(suggesting_player)
-        
+        suggester_name = suggesting_player.get_colored_name()
+
         refuting_player = None
         shown_card = None
         
@@ -406,16 +460,17 @@ class Cluedo:
             if not player.can_refute():
                 continue
             
-            input(f"\nPress enter to have {player.get_colored_name()} check for refutation...")
+            player_name = player.get_colored_name()
+            input(f"\nPress enter to have {player_name} check for refutation...")
             # Check which cards this player has that match the suggestion
-            matching_cards = []
-            for card in [suggestion['suspect'], suggestion['weapon'], suggestion['room']]:
-                if player.has_card(card):
-                    matching_cards.append(card)
+            matching_cards = [
+                suggestion[key] for key in self.SUGGESTION_KEYS
+                if player.has_card(suggestion[key])
+            ]
             
             # If player has matching cards, they must show one
             if matching_cards:
-                print(f"\n{player.get_colored_name()} has a card to show.")
+                print(f"\n{player_name} has a card to show.")
                 
                 if len(matching_cards) == 1:
                     # Only one card to show
@@ -426,10 +481,9 @@ class Cluedo:
                 
                 # Only the suggesting player sees the actual card
                 self.clear_screen()
-                input(f"\nPress enter to reveal the card to {suggesting_player.get_colored_name()}...")
-                print(f"\n{suggesting_player.get_colored_name()} privately sees: {card_to_show}")
+                input(f"\nPress enter to reveal the card to {suggester_name}...")
+                print(f"\n{suggester_name} privately sees: {card_to_show}")
                 input("Press enter to continue...")
-                input("Press Enter to continue...")
                 self.clear_screen()
                 refuting_player = player
                 shown_card = card_to_show
@@ -469,42 +523,34 @@ class Cluedo:
             print("\nNo suggestions have been made yet.")
             return
         
-        print("\n" + "=" * 80)
-        print("SUGGESTION LOG".center(80))
-        print("=" * 80)
-        
+        bar = "=" * 80
+        lines = ["\n" + bar, "SUGGESTION LOG".center(80), bar]
+
         for entry in self.suggestion_log:
-            print(f"\nTurn {entry['turn']}: {entry['suggesting_player']}")
-            print(f"  Suggested: {entry['suggestion']['suspect']} with the {entry['suggestion']['weapon']} in the {entry['suggestion']['room']}")
-            
+            lines.append(f"\nTurn {entry['turn']}: {entry['suggesting_player']}")
+            lines.append(f"  Suggested: {entry['suggestion']['suspect']} with the {entry['suggestion']['weapon']} in the {entry['suggestion']['room']}")
+
             if entry['refuting_player']:
-                print(f"  Refuted by: {entry['refuting_player']}")
+                lines.append(f"  Refuted by: {entry['refuting_player']}")
                 # Note: shown_card is visible to all players in the log
-                print(f"    Card shown: {entry['shown_card']}")
+                lines.append(f"    Card shown: {entry['shown_card']}")
             else:
-                print("  No one could refute!")
-        
-        print("\n" + "=" * 80)
+                lines.append("  No one could refute!")
+
+        lines.append("\n" + bar)
+        print("\n".join(lines))
 
 
     def print_available_actions(self) -> None:
         '''Prints the available actions for the player using descriptions from action classes.'''
-        print("Available actions:")
-        for action_name in self.action_factory.get_registered_actions():
-            if action_name:  # Skip empty string action
-                try:
-                    action = self.action_factory.create_action(action_name)
-                    description = action.get_description()
-                    print(f"- {action_name}: {description}")
-                except Exception:
-                    print(f"- {action_name}: (No description available)")
+        print(self._actions_prompt)
 
     def display_players_cards(self) -> None:
         '''Displays all players and their cards (for dev/testing purposes).'''
-        print("\n=== PLAYERS AND THEIR CARDS ===")
+        lines = ["\n=== PLAYERS AND THEIR CARDS ==="]
         for player in self.players:
-            print(f"\n{player.get_colored_name()}'s cards:")
-            for card in player.get_cards():
-                print(f"- {card}")
-        print("================================\n")
+            lines.append(f"\n{player.get_colored_name()}'s cards:")
+            lines.extend(f"- {card}" for card in player.get_cards())
+        lines.append("================================\n")
+        print("\n".join(lines))
 
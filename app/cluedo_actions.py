@@ -109,15 +109,11 @@ class EnterRoomAction(PlayerAction):
         # Display the board first
         game.board.display_board(game.get_players())
         
-        # Display available rooms with their letters from rules
-        room_list = []
-        for room_name in game.rules.get_rooms():
-            room_symbol = game.board.get_room_symbol(room_name)
-            room_list.append(f"{room_name} ({room_symbol})")
-        print(f"\nRooms available to enter: {', '.join(room_list)}")
+        # Display available rooms with their letters (preformatted once)
+        print(f"\nRooms available to enter: {game.get_room_prompt()}")
         
         room_name = input("Enter the room name to enter: ")
-        if room_name not in game.rules.get_rooms():
+        if room_name not in game.rules.get_room_set():
             raise InvalidActionException(f"{room_name} is not a valid room.")
         try:
             player.enter_room(room_name)
@@ -151,8 +147,8 @@ class ExitRoomAction(PlayerAction):
         door_locations = game.board.get_door_locations(room_name)
         room_layout = game.board.get_room_layout(room_name)
         
-        # Ask player to select a door
-        print(f"\nAvailable doors: {', '.join([str(i+1) for i in range(len(door_locations))])}")
+        # Ask player to select a door (prompt preformatted per room)
+        print(f"\n{game.board.get_door_prompt(room_name)}")
         door_choice = input("Enter door number to exit through: ")
         
         try:
@@ -267,7 +263,7 @@ class AccuseAction(PlayerAction):
         # Room must be chosen by the player
         print(f"\nAvailable rooms: {', '.join(game.rules.get_rooms())}")
         room = input("Enter room name: ")
-        if room not in game.rules.get_rooms():
+        if room not in game.rules.get_room_set():
             raise InvalidActionException(f"{room} is not a valid room.")
         
         accusation = {
@@ -439,32 +435,39 @@ class PlayerActionFactory:
     def __init__(self):
         '''Initialize the factory with action mappings.'''
         self._actions = {}
-    
+        self._instances = {}  # Actions are stateless, so one instance each
+
     def register_action(self, action_name, action_class):
         '''Register an action with the factory.
-        
+
         Args:
             action_name: String identifier for the action
             action_class: Class that implements PlayerAction
         '''
         self._actions[action_name] = action_class
-    
+        self._instances.pop(action_name, None)
+
     def create_action(self, action_name):
-        '''Create an action instance.
-        
+        '''Create an action instance (cached; actions hold no state).
+
         Args:
             action_name: String identifier for the action
-            
+
         Returns:
             Instance of PlayerAction subclass
-            
+
         Raises:
             InvalidActionException: If action_name not registered
         '''
+        action = self._instances.get(action_name)
+        if action is not None:
+            return action
         action_class = self._actions.get(action_name)
         if action_class is None:
             raise InvalidActionException(f"Unknown action: {action_name}")
-        return action_class()
+        action = action_class()
+        self._instances[action_name] = action
+        return action
     
     def get_registered_actions(self):
         '''Returns list of registered action names.'''
@@ -1,9 +1,19 @@
+import os
+import sys
+
 from colorama import init, Fore
 
+# Color is only worthwhile on an interactive terminal; piped/redirected
+# output (or NO_COLOR) gets plain text with no ANSI codes anywhere
+USE_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+
+
 class Config:
     def __init__(self):
-        # Initialize colorama for cross-platform colored output
-        init(autoreset=True)
+        # Initialize colorama for cross-platform colored output; skipped
+        # off-TTY so headless runs never get stdout wrapped
+        if USE_COLOR:
+            init(autoreset=True)
     
     def get_player_colors(self):
         '''Returns colorama color codes for each player.'''
@@ -2,11 +2,26 @@ import random
 
 from colorama import Fore, Style
 try:
+    from app.config import USE_COLOR as _USE_COLOR
     from app.exceptions import InvalidMoveException, InvalidActionException
 except ImportError:
+    from config import USE_COLOR as _USE_COLOR
     from exceptions import InvalidMoveException, InvalidActionException
 
 
+# Shared PRNG for dice rolls; avoids the module-level random instance's
+# lock and attribute lookups on every roll
+_rng = random.Random()
+
+# Movement direction -> (row, col) offset lookup for Player.move
+_DIRECTION_OFFSETS = {
+    'up': (-1, 0),
+    'down': (1, 0),
+    'left': (0, -1),
+    'right': (0, 1)
+}
+
+
 class Player:
     '''Base class representing a player in the Cluedo game.'''
     
@@ -29,9 +44,12 @@ class Player:
         self.previous_position = None
         self.current_room = None  # Name of room player is in, None if in hallway
         self.cards = []  # Cards held by this player
+        self._card_set = set()  # Mirrors self.cards for O(1) has_card checks
         self.is_active = True  # Whether player is still in game
         self.is_eliminated = False  # Whether player made wrong accusation
         self.roll = 0  # Current dice roll (die1, die2)
+        self._colored_name = None  # Lazily built colored display name
+        self._colored_symbol = None  # Lazily built colored board symbol
         
     def __str__(self):
         '''String representation of the player.'''
@@ -43,12 +61,13 @@ class Player:
     
     def add_card(self, card):
         '''Add a card to the player's hand.'''
-        if card not in self.cards:
+        if card not in self._card_set:
             self.cards.append(card)
-    
+            self._card_set.add(card)
+
     def has_card(self, card):
         '''Check if player has a specific card.'''
-        return card in self.cards
+        return card in self._card_set
     
     def choose_card_to_show(self, matching_cards, to_player):
         '''Allows this player to choose which card to show when they have multiple matches.
@@ -109,9 +128,14 @@ class Player:
             print(f"{self.get_colored_name()}'s cards: {', '.join(self.get_cards())}")
             
     def get_colored_name(self):
-        '''Returns the player name with color formatting and reset.'''
-        return f"{self.color}{self.name}{Style.RESET_ALL}"
-    
+        '''Returns the player name with color formatting and reset (plain off-TTY).'''
+        if self._colored_name is None:
+            if _USE_COLOR:
+                self._colored_name = f"{self.color}{self.name}{Style.RESET_ALL}"
+            else:
+                self._colored_name = self.name
+        return self._colored_name
+
     def display_info(self):
         '''Display player information.'''
         print(f"\n{self.get_colored_name()}")
@@ -123,7 +147,7 @@ class Player:
 
     def roll_die(self):
         '''Set the player's current dice roll.'''
-        die = random.randint(1, 6)
+        die = _rng.randint(1, 6)
         self.roll = die
         return die
 
@@ -138,18 +162,11 @@ class Player:
     
     def move(self, direction):
         '''Move the player in the specified direction.'''
+        offset = _DIRECTION_OFFSETS.get(direction.lower())
+        if offset is None:
+            raise InvalidActionException("Invalid move direction. Use 'up', 'down', 'left', or 'right'.")
         row, col = self.current_position
-        match direction.lower():
-            case 'up':
-                self.move_to((row - 1, col))
-            case 'down':
-                self.move_to((row + 1, col))
-            case 'left':
-                self.move_to((row, col - 1))
-            case 'right':
-                self.move_to((row, col + 1))
-            case _:
-                raise InvalidActionException("Invalid move direction. Use 'up', 'down', 'left', or 'right'.")
+        self.move_to((row + offset[0], col + offset[1]))
     
     def get_player_position(self):
         '''Return the player's current position.'''
@@ -200,8 +217,13 @@ class Player:
         return self.is_eliminated
     
     def get_colored_symbol(self):
-        '''Returns the player's symbol with color formatting and reset.'''
-        return f"{self.color}{self.symbol}{Style.RESET_ALL}"
+        '''Returns the player's symbol with color formatting and reset (plain off-TTY).'''
+        if self._colored_symbol is None:
+            if _USE_COLOR:
+                self._colored_symbol = f"{self.color}{self.symbol}{Style.RESET_ALL}"
+            else:
+                self._colored_symbol = self.symbol
+        return self._colored_symbol
     
     def can_take_turn(self):
         '''Returns whether this player can take turns.'''
@@ -218,6 +240,7 @@ class Player:
         dst.previous_position = src.previous_position
         dst.current_room = src.current_room
         dst.cards = list(src.cards)
+        dst._card_set = set(src.cards)
         dst.roll = src.roll
         dst.is_active = src.is_active
         dst.is_eliminated = src.is_eliminated
@@ -230,10 +253,6 @@ class ActivePlayer(Player):
         super().__init__(name, color, symbol, start_position)
         self.is_active = True
         self.is_eliminated = False
-    
-    def get_colored_name(self):
-        '''Returns the player name with color formatting (active).'''
-        return f"{self.color}{self.name}{Style.RESET_ALL}"
 
 
 class InactivePlayer(Player):
@@ -254,7 +273,12 @@ class InactivePlayer(Player):
     
     def get_colored_name(self):
         '''Returns the player name with color formatting and [INACTIVE] tag.'''
-        return f"{self.color}{self.name} [INACTIVE]{Style.RESET_ALL}"
+        if self._colored_name is None:
+            if _USE_COLOR:
+                self._colored_name = f"{self.color}{self.name} [INACTIVE]{Style.RESET_ALL}"
+            else:
+                self._colored_name = f"{self.name} [INACTIVE]"
+        return self._colored_name
 
 
 class EliminatedPlayer(Player):
@@ -275,7 +299,12 @@ class EliminatedPlayer(Player):
     
     def get_colored_name(self):
         '''Returns the player name with color formatting and [ELIMINATED] tag.'''
-        return f"{self.color}{self.name} [ELIMINATED]{Style.RESET_ALL}"
+        if self._colored_name is None:
+            if _USE_COLOR:
+                self._colored_name = f"{self.color}{self.name} [ELIMINATED]{Style.RESET_ALL}"
+            else:
+                self._colored_name = f"{self.name} [ELIMINATED]"
+        return self._colored_name
     
     @classmethod
     def from_player(cls, src):
@@ -1,48 +1,65 @@
 class Rules:
     def __init__(self):
-        pass
-        
-    def get_dimensions(self):
-        '''Returns the dimensions of the game board as (length, width).'''
-        self.length = 22  
+        # Build the static game data once so repeated get_*() calls
+        # return the cached lists instead of rebuilding them.
+        self.length = 22
         self.width = 22
-        return self.length, self.width
-    
-    def get_rooms(self):
-        '''Returns the rooms in the game.'''
         self.rooms = [
             "Kitchen", "Ballroom", "Conservatory", "Dining Room",
             "Lounge", "Hall", "Study", "Library", "Billiard Room"
         ]
-        return self.rooms
-
-    def get_weapons(self):
-        '''Returns the weapons in the game.'''
         self.weapons = [
             "Candlestick", "Dagger", "Lead Pipe", "Revolver",
             "Rope", "Wrench"
         ]
-        return self.weapons
-
-    def get_suspects(self):
-        '''Returns the suspects in the game.'''
         self.suspects = [
             "Miss Scarlet", "Colonel Mustard", "Mrs. White",
             "Mr. Green", "Mrs. Peacock", "Professor Plum"
         ]
+        # Frozen sets of the same data for O(1) validity checks
+        self.room_set = frozenset(self.rooms)
+        self.weapon_set = frozenset(self.weapons)
+        self.suspect_set = frozenset(self.suspects)
+
+    def get_dimensions(self):
+        '''Returns the dimensions of the game board as (length, width).'''
+        return self.length, self.width
+
+    def get_rooms(self):
+        '''Returns the rooms in the game.'''
+        return self.rooms
+
+    def get_weapons(self):
+        '''Returns the weapons in the game.'''
+        return self.weapons
+
+    def get_suspects(self):
+        '''Returns the suspects in the game.'''
         return self.suspects
-    
+
+    def get_room_set(self):
+        '''Returns the rooms as a frozenset for membership checks.'''
+        return self.room_set
+
+    def get_weapon_set(self):
+        '''Returns the weapons as a frozenset for membership checks.'''
+        return self.weapon_set
+
+    def get_suspect_set(self):
+        '''Returns the suspects as a frozenset for membership checks.'''
+        return self.suspect_set
+
     def get_player_symbols(self):
         '''Returns the symbols used to represent each player on the board.'''
         return {
             "Miss Scarlet": "S",
-            "Colonel Mustard": "M", 
+            "Colonel Mustard": "M",
             "Mrs. White": "W",
             "Mr. Green": "G",
             "Mrs. Peacock": "P",
-            "Professor Plum": "L"  
+            "Professor Plum": "L"
         }
-    
+
     def get_board_symbols(self):
         '''Returns the symbols used in room layouts.'''
         return {
@@ -59,7 +76,7 @@ class Rules:
             'I': 'Billiard Room',
             '.': 'Empty Space/Hallway'
         }
-    
+
     def get_secret_passages(self):
         '''Returns the secret passage connections between rooms.'''
         return {